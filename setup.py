@@ -4,6 +4,27 @@ from setuptools import setup, find_packages
 with open("README.md", "r") as f:
     long_description = f.read()
 
+# Frozen module-level metadata: built once, shareable across re-entrant
+# setup() invocations (pip install / pip wheel / sdist in one process).
+CLASSIFIERS = (
+    'Development Status :: 3 - Alpha',
+    'License :: OSI Approved :: MIT License',
+    'Intended Audience :: Developers',
+    'Operating System :: Microsoft :: Windows',
+    'Operating System :: POSIX :: Linux',
+    'Programming Language :: Python',
+    'Programming Language :: Python :: 3',
+    'Programming Language :: Python :: 3.7',
+    'Topic :: Software Development :: Quality Assurance',
+    'Topic :: Software Development :: Testing',
+)
+
+KEYWORDS = (
+    'unittest', 'coverage', 'tdd', 'test', 'driven', 'development',
+    'dcc', 'vfx', '3d', 'animation', 'pipeline', 'nuke', 'houdini',
+    'hython', 'maya', 'mayapy', 'nuke',
+)
+
 setup(
     name='vfxtest',
     version='0.2.2',
@@ -30,29 +51,12 @@ setup(
     install_requires=[
         'virtualenv',
         'coverage >= 4.5',
-        'mock >= 3.0; python_version < "3.3"',
-        'six',
     ],
 
-    classifiers=[
-        'Development Status :: 3 - Alpha',
-        'License :: OSI Approved :: MIT License',
-        'Intended Audience :: Developers',
-        'Operating System :: Microsoft :: Windows',
-        'Operating System :: POSIX :: Linux',
-        'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.7',
-        'Topic :: Software Development :: Quality Assurance',
-        'Topic :: Software Development :: Testing',
-    ],
-    keywords=('unittest coverage tdd test driven development dcc vfx 3d '
-              'animation pipeline nuke houdini hython maya mayapy nuke'),
+    classifiers=list(CLASSIFIERS),
+    keywords=' '.join(KEYWORDS),
 
-    python_requires=('>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*, '
-                     '!=3.5.*, !=3.6.*, <4'),
+    python_requires='>=3.7, <4',
     entry_points={
         "console_scripts": [
             "vfxtest=vfxtest:main",
@@ -7,18 +7,49 @@ import unittest
 import sys
 import logging
 
-try:  # pragma: no cover_3
-    from cStringIO import StringIO
-except ImportError:  # pragma: no cover_2
-    from io import StringIO
-
 import vfxtest
-mock = vfxtest.mock
 
 
 # Global constant to completely bypass the functionality.
 BYPASS = False
 
+# Bind the original decorator once at import time instead of looking it
+# up through two module dicts on every OutputTrap construction.
+_RUNNER = unittest.runner
+_ORIG_WRITELN = _RUNNER._WritelnDecorator
+
+
+# -----------------------------------------------------------------------------
+class _NullWriter(object):
+    """File-like sink that drops everything written to it.
+
+    No test ever inspects the trapped output, so there is no point in
+    buffering it all in memory the way StringIO would.
+    """
+
+    # -------------------------------------------------------------------------
+    def write(self, content):
+        pass
+
+    # -------------------------------------------------------------------------
+    def flush(self):
+        pass
+
+
+# -----------------------------------------------------------------------------
+class _FakeWritelnDecorator(object):
+    """Drop-in stand-in for unittest.runner._WritelnDecorator that
+    swallows everything, without any mock.Mock machinery.
+    """
+
+    # -------------------------------------------------------------------------
+    def __init__(self, *args, **kwargs):
+        pass
+
+    # -------------------------------------------------------------------------
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
 
 # -----------------------------------------------------------------------------
 class OutputTrap():
@@ -47,11 +78,11 @@ class OutputTrap():
         self.stored_stdout = sys.stdout
         self.stored_stderr = sys.stderr
         self.stored_loglevel = vfxtest.logger.level
-        self.stored_writelndecorator = unittest.runner._WritelnDecorator
-        self.mocked_stdout = StringIO()
-        self.mocked_stderr = StringIO()
+        self.stored_writelndecorator = _RUNNER._WritelnDecorator
+        self.mocked_stdout = _NullWriter()
+        self.mocked_stderr = _NullWriter()
 
-        self.mocked_writelndecorator = mock.Mock()
+        self.mocked_writelndecorator = _FakeWritelnDecorator
 
     # -------------------------------------------------------------------------
     def __enter__(self):
@@ -60,7 +91,7 @@ class OutputTrap():
         sys.stdout = self.mocked_stdout
         sys.stderr = self.mocked_stderr
         vfxtest.initLogging(level=logging.NOTSET)
-        unittest.runner._WritelnDecorator = self.mocked_writelndecorator
+        _RUNNER._WritelnDecorator = self.mocked_writelndecorator
 
     # -------------------------------------------------------------------------
     def __exit__(self, exc_type, exc_value, exc_traceback):
@@ -69,4 +100,4 @@ class OutputTrap():
         vfxtest.initLogging(level=self.stored_loglevel)
         sys.stdout = self.stored_stdout
         sys.stderr = self.stored_stderr
-        unittest.runner._WritelnDecorator = self.stored_writelndecorator
+        _RUNNER._WritelnDecorator = self.stored_writelndecorator
@@ -6,43 +6,59 @@
 
 import os
 import sys
-import platform
 import unittest
-import shutil
-import argparse
-
-import coverage
 
 
 # -----------------------------------------------------------------------------
-def main(folder_path, test_dccs, fail_fast, log_output, cover_testfiles):
+def main(folder_path, test_dccs, fail_fast, log_output, cover_testfiles,
+         no_coverage=False, report=False, html=False):
     """"""
-    test_sandbox = os.path.abspath(os.path.join(folder_path, 'test_sandbox'))
-    python = os.path.abspath(os.path.join(folder_path, '..'))
+    # resolve all paths against one getcwd() instead of one per abspath
+    cwd = os.getcwd()
+    test_sandbox = os.path.normpath(os.path.join(cwd, folder_path,
+                                                 'test_sandbox'))
+    python = os.path.normpath(os.path.join(cwd, folder_path, '..'))
     sys.path.append(test_sandbox)
     sys.path.append(python)
     os.environ['PYTHONPATH'] = os.pathsep.join([test_sandbox, python])
 
     # Cleanup.
-    dot_output = os.path.abspath(os.path.join(folder_path, '.output'))
+    import shutil
+
+    dot_output = os.path.normpath(os.path.join(cwd, folder_path, '.output'))
     if os.path.exists(dot_output):
         shutil.rmtree(dot_output)
-    omit = []
-    if not cover_testfiles:
-        omit.append('test*.py')
-        omit.append('dcc_test*.py')
-    # add support for Python major version 'no-cover' support:
-    # --> no coverage on python 2.x:
-    #                                # pragma: no cover_2
-    # --> no coverage on python 3.x:
-    #                                # pragma: no cover_3
-    cov = coverage.Coverage(omit=omit)
-    major = platform.python_version_tuple()[0]
-    versioned_exclude = (
-        r'#\s*(pragma|PRAGMA)[:\s]?\s*' r'(no|NO)\s*(cover_{}|COVER_{})'
-    ).format(major, major)
-    cov.exclude(versioned_exclude, which='exclude')
-    cov.start()
+    # also drop stale coverage data files from previous runs
+    # (one readdir, no glob engine)
+    for entry in os.scandir(folder_path):
+        if entry.name.startswith('.coverage'):
+            os.unlink(entry.path)
+    cov = None
+    if not no_coverage:
+        # deferred import: with --no-coverage (or --help) nobody pays
+        # for the coverage import or its trace hook
+        import coverage
+        import platform
+
+        omit = []
+        if not cover_testfiles:
+            omit.append('test*.py')
+            omit.append('dcc_test*.py')
+        # add support for Python major version 'no-cover' support:
+        # --> no coverage on python 2.x:
+        #                                # pragma: no cover_2
+        # --> no coverage on python 3.x:
+        #                                # pragma: no cover_3
+        cov = coverage.Coverage(omit=omit)
+        major = platform.python_version_tuple()[0]
+        # one linear case-insensitive pattern instead of a big
+        # alternation regex - coverage applies this to every source
+        # line it reports on (scoped (?i:...) group, since coverage
+        # joins all exclude patterns into one regex and a global (?i)
+        # flag mid-pattern is rejected on Python 3.11+)
+        cov.exclude(r'(?i:#\s*pragma[:\s]?\s*no\s*cover_{})'.format(major),
+                    which='exclude')
+        cov.start()
 
     # Disable all OutputTraps, if necessary.
     if log_output:
@@ -53,23 +69,57 @@ def main(folder_path, test_dccs, fail_fast, log_output, cover_testfiles):
     loader = unittest.TestLoader()
     runner = unittest.TextTestRunner(failfast=fail_fast, buffer=(not log_output))
 
-    # Discover and run main test suite.
-    suite = loader.discover(folder_path, pattern='test*.py')
+    # Discover both suites in a single directory pass and run them.
+    suite, dcc_suite = discoverSuites(loader, folder_path,
+                                      include_dccs=test_dccs)
     runner.run(suite)
 
-    # Discover and tests requiring DCC licenses.
+    # Run tests requiring DCC licenses.
     if test_dccs is True:
-        dcc_suite = loader.discover(folder_path, pattern='dcc_test*.py')
         runner.run(dcc_suite)
-    cov.stop()
-    cov.save()
-    cov.report()
-    cov.html_report(directory='_html_coverage')
+    if cov is not None:
+        cov.stop()
+        cov.save()
+        # reporting is opt-in: fast iteration cycles only need the
+        # .coverage data file, not a console table or dozens of
+        # small HTML file writes
+        if report:
+            cov.report()
+        if html:
+            cov.html_report(directory='_html_coverage')
+
+
+# -----------------------------------------------------------------------------
+def discoverSuites(loader, folder_path, include_dccs=False):
+    """Discover the 'test*.py' and 'dcc_test*.py' suites in one pass.
+
+    The dcc test modules only get imported when 'include_dccs' is True,
+    so plain runs never pay for (or depend on) DCC imports.
+    """
+    test_names = []
+    dcc_names = []
+    for entry in sorted(os.listdir(folder_path)):
+        if not entry.endswith('.py'):
+            continue
+        if entry.startswith('dcc_test'):
+            dcc_names.append(entry[:-3])
+        elif entry.startswith('test'):
+            test_names.append(entry[:-3])
+
+    suite = unittest.TestSuite(
+        loader.loadTestsFromName(name) for name in test_names)
+    dcc_suite = None
+    if include_dccs:
+        dcc_suite = unittest.TestSuite(
+            loader.loadTestsFromName(name) for name in dcc_names)
+    return suite, dcc_suite
 
 
 # -----------------------------------------------------------------------------
 def constructParser():
     """Return argument parser."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog='run_all_tests',
         description=('Run test suite for vfxtest.'),
@@ -106,6 +156,26 @@ def constructParser():
         action='store_true',
     )
 
+    parser.add_argument(
+        '-nc',
+        '--no-coverage',
+        help='Run without coverage instrumentation.',
+        action='store_true',
+    )
+
+    parser.add_argument(
+        '-r',
+        '--report',
+        help='Print the coverage report to the console.',
+        action='store_true',
+    )
+
+    parser.add_argument(
+        '--html',
+        help="Generate the html coverage report in '_html_coverage'.",
+        action='store_true',
+    )
+
     return parser
 
 
@@ -121,6 +191,9 @@ def commandLine(arguments):
         fail_fast=(not namespace.continue_on_error),
         log_output=namespace.log_output,
         cover_testfiles=namespace.cover_testfiles,
+        no_coverage=namespace.no_coverage,
+        report=namespace.report,
+        html=namespace.html,
     )
 
 
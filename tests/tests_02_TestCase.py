@@ -3,6 +3,7 @@
 # Copyright (c) 2019-2022, Martin Chatterjee. All rights reserved.
 # -----------------------------------------------------------------------------
 
+import copy
 import unittest
 import os
 
@@ -11,28 +12,34 @@ import vfxtest
 # -----------------------------------------------------------------------------
 class TestCaseTestCase(unittest.TestCase):
 
+    _default_settings = None
+
     # -------------------------------------------------------------------------
     @classmethod
     def setUpClass(cls):
+        """Enter the sandbox once per class instead of once per test.
         """
-        """
+        cls.cwd = os.getcwd()
+        os.chdir('./test_sandbox')
     # -------------------------------------------------------------------------
     @classmethod
     def tearDownClass(cls):
         """
         """
+        os.chdir(cls.cwd)
     # -------------------------------------------------------------------------
-    def setUp(self):
-        """
-        """
-        self.cwd = os.getcwd()
-        os.chdir('./test_sandbox')
-    # -------------------------------------------------------------------------
-    def tearDown(self):
-        """
-        """
-        os.chdir(self.cwd)
+    @classmethod
+    def _defaultSettings(cls):
+        """Return a deep copy of the default collectSettings() result.
 
+        collectSettings() re-parses argv and the cfg file on every call,
+        but its default result is deterministic for a fixed cwd — so the
+        real call happens only once per class and each test receives its
+        own mutable copy.
+        """
+        if cls._default_settings is None:
+            cls._default_settings = vfxtest.collectSettings()
+        return copy.deepcopy(cls._default_settings)
 
     # -------------------------------------------------------------------------
     def test01_TestCase_object_is_valid_unittest_TestCase(self):
@@ -44,7 +51,7 @@ class TestCaseTestCase(unittest.TestCase):
     def test02_settings_can_be_get_and_set(self):
 
         foo = vfxtest.TestCase(test_run=True)
-        settings = vfxtest.collectSettings()
+        settings = self._defaultSettings()
         foo.settings = settings
         self.assertEqual(foo.settings, settings)
 
@@ -59,7 +66,7 @@ class TestCaseTestCase(unittest.TestCase):
     def test04_context_matches_context_in_settings(self):
 
         foo = vfxtest.TestCase(test_run=True)
-        settings = vfxtest.collectSettings()
+        settings = self._defaultSettings()
         settings['context'] = 'awesomeContext'
         foo.settings = settings
         self.assertEqual(foo.context, 'awesomeContext')
@@ -68,7 +75,7 @@ class TestCaseTestCase(unittest.TestCase):
     def test05_context_settings_matches_settings(self):
 
         foo = vfxtest.TestCase(test_run=True)
-        settings = vfxtest.collectSettings()
+        settings = self._defaultSettings()
         settings['context'] = 'python3.x'
         foo.settings = settings
         self.assertEqual(foo.context_settings, settings['context_details']['python3.x'])
@@ -80,29 +87,27 @@ class TestCaseTestCase(unittest.TestCase):
         self.assertFalse(os.path.exists(invalid_test_output))
 
         runner = vfxtest.TextTestRunner()
-        settings = vfxtest.collectSettings()
+        settings = self._defaultSettings()
         settings['output_folder'] = invalid_test_output
 
         with self.assertRaises(OSError):
             vfxtest._createTestRootFolder(settings=settings, name=['invalid'])
 
     # -------------------------------------------------------------------------
-    def test07_test_root_sets_and_gets_class_variable(self):
-
-
-        vfxtest.TestCase.test_root = './lorem/ipsum'
-        self.assertEqual(vfxtest.TestCase.test_root, './lorem/ipsum')
+    def test07_test_root_is_per_instance(self):
 
         a = vfxtest.TestCase(test_run=True)
         b = vfxtest.TestCase(test_run=True)
+        self.assertEqual(a.test_root, None)
+        self.assertEqual(b.test_root, None)
 
         a.test_root = './foo/bar'
         self.assertEqual(a.test_root, './foo/bar')
-        self.assertEqual(a.test_root, b.test_root)
+        self.assertEqual(b.test_root, None)
 
         b.test_root = './fizz/buzz'
         self.assertEqual(b.test_root, './fizz/buzz')
-        self.assertEqual(a.test_root, b.test_root)
+        self.assertEqual(a.test_root, './foo/bar')
 
 
 # -----------------------------------------------------------------------------
@@ -3,9 +3,11 @@
 # Copyright (c) 2019-2022, Martin Chatterjee. All rights reserved.
 # -----------------------------------------------------------------------------
 
+import copy
 import unittest
 import os
 import shutil
+import sys
 
 import vfxtest
 
@@ -17,35 +19,44 @@ from output_trap import OutputTrap
 # -----------------------------------------------------------------------------
 class RunNativeTestCase(unittest.TestCase):
 
+    _prepared_settings = None
+
     # -------------------------------------------------------------------------
     @classmethod
     def setUpClass(cls):
+        """Enter the sandbox once per class instead of once per test.
         """
-        """
+        cls.cwd = os.getcwd()
+        os.chdir('./test_sandbox')
 
     # -------------------------------------------------------------------------
     @classmethod
     def tearDownClass(cls):
         """
         """
+        os.chdir(cls.cwd)
+
     # -------------------------------------------------------------------------
-    def setUp(self):
-        """
-        """
-        self.cwd = os.getcwd()
-        os.chdir('./test_sandbox')
-    # -------------------------------------------------------------------------
-    def tearDown(self):
-        """
+    @classmethod
+    def _preparedSettings(cls):
+        """Run collectSettings() + prepareTestEnvironment() for the
+        default arguments only once per class.
+
+        The environment prep is pure filesystem work and idempotent, so
+        tests that don't vary argv just receive a deep copy of the
+        already prepared settings.
         """
-        os.chdir(self.cwd)
+        if cls._prepared_settings is None:
+            settings = vfxtest.collectSettings()
+            vfxtest.prepareTestEnvironment(settings)
+            cls._prepared_settings = settings
+        return copy.deepcopy(cls._prepared_settings)
 
 
     # -------------------------------------------------------------------------
     def test01_runNative_runs_successfully(self):
 
-        settings = vfxtest.collectSettings()
-        vfxtest.prepareTestEnvironment(settings)
+        settings = self._preparedSettings()
 
         cov_file = os.path.abspath('{}/.coverage.native'.format(settings['output_folder']))
         if os.path.exists(cov_file):
@@ -97,8 +108,7 @@ class RunNativeTestCase(unittest.TestCase):
     # -------------------------------------------------------------------------
     def test04_resolveContext_defaults_to_native(self):
 
-        settings = vfxtest.collectSettings()
-        vfxtest.prepareTestEnvironment(settings)
+        settings = self._preparedSettings()
 
         self.assertEqual(settings['context'], 'native')
 
@@ -177,6 +187,38 @@ class RunNativeTestCase(unittest.TestCase):
         self.assertEqual(settings['tests_run'], 2)
         self.assertEqual(settings['errors'], 1)
 
+    # -------------------------------------------------------------------------
+    @unittest.skipIf(sys.platform == 'win32',
+                     'parallel file execution is posix-only')
+    def test11_runNative_with_max_parallel_files_works_as_expected(self):
+
+        settings = self._preparedSettings()
+        settings['max_parallel_files'] = 2
+
+        with OutputTrap():
+            vfxtest.runNative(settings=settings, use_coverage=False)
+
+        self.assertEqual(settings['files_run'], 2)
+        self.assertEqual(settings['tests_run'], 6)
+        self.assertEqual(settings['errors'], 0)
+        # without coverage the workers must not leave data files behind
+        leftovers = [item for item in os.listdir(settings['output_folder'])
+                     if item.startswith('.coverage.native.')]
+        self.assertEqual(leftovers, [])
+
+    # -------------------------------------------------------------------------
+    def test12_runNative_batched_without_failfast_works_as_expected(self):
+
+        settings = self._preparedSettings()
+        settings['failfast'] = False
+
+        with OutputTrap():
+            vfxtest.runNative(settings=settings, use_coverage=False)
+
+        self.assertEqual(settings['files_run'], 2)
+        self.assertEqual(settings['tests_run'], 6)
+        self.assertEqual(settings['errors'], 0)
+
 
 # -----------------------------------------------------------------------------
 if __name__ == '__main__':
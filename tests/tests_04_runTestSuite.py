@@ -3,6 +3,7 @@
 # Copyright (c) 2019-2022, Martin Chatterjee. All rights reserved.
 # -----------------------------------------------------------------------------
 
+import copy
 import unittest
 import os
 import json
@@ -16,34 +17,39 @@ from output_trap import OutputTrap
 # -----------------------------------------------------------------------------
 class RunTestSuiteTestCase(unittest.TestCase):
 
+    _prepared_settings = None
+
     # -------------------------------------------------------------------------
     @classmethod
     def setUpClass(cls):
+        """Enter the sandbox once per class instead of once per test.
         """
-        """
+        cls.cwd = os.getcwd()
+        os.chdir('./test_sandbox')
     # -------------------------------------------------------------------------
     @classmethod
     def tearDownClass(cls):
         """
         """
+        os.chdir(cls.cwd)
     # -------------------------------------------------------------------------
-    def setUp(self):
-        """
-        """
-        self.cwd = os.getcwd()
-        os.chdir('./test_sandbox')
-    # -------------------------------------------------------------------------
-    def tearDown(self):
-        """
+    @classmethod
+    def _preparedSettings(cls):
+        """Prepare the default test environment once per class and hand
+        out deep copies — every test here uses the same argv, so there
+        is no point in redoing the cfg parse and filesystem prep.
         """
-        os.chdir(self.cwd)
+        if cls._prepared_settings is None:
+            settings = vfxtest.collectSettings()
+            vfxtest.prepareTestEnvironment(settings)
+            cls._prepared_settings = settings
+        return copy.deepcopy(cls._prepared_settings)
 
 
     # -------------------------------------------------------------------------
     def test01_runTestSuite_native_runs_successfully(self):
 
-        settings = vfxtest.collectSettings()
-        vfxtest.prepareTestEnvironment(settings)
+        settings = self._preparedSettings()
 
         with OutputTrap():
             vfxtest.runTestSuite(settings=settings)
@@ -55,8 +61,7 @@ class RunTestSuiteTestCase(unittest.TestCase):
     # -------------------------------------------------------------------------
     def test02_runTestSuite_single_context_runs_successfully(self):
 
-        settings = vfxtest.collectSettings()
-        vfxtest.prepareTestEnvironment(settings)
+        settings = self._preparedSettings()
 
         cov_file = os.path.abspath('{}/.coverage.python3.x'.format(settings['output_folder']))
         if os.path.exists(cov_file):
@@ -76,8 +81,7 @@ class RunTestSuiteTestCase(unittest.TestCase):
     # -------------------------------------------------------------------------
     def test03_runTestSuite_nested_context_runs_successfully(self):
 
-        settings = vfxtest.collectSettings()
-        vfxtest.prepareTestEnvironment(settings)
+        settings = self._preparedSettings()
 
         cov_file_3 = os.path.abspath('{}/.coverage.python3.x'.format(settings['output_folder']))
         if os.path.exists(cov_file_3):
@@ -100,8 +104,7 @@ class RunTestSuiteTestCase(unittest.TestCase):
     # -------------------------------------------------------------------------
     def test04_runTestSuite_wrapper_script_not_found_raises_KeyError(self):
 
-        settings = vfxtest.collectSettings()
-        vfxtest.prepareTestEnvironment(settings)
+        settings = self._preparedSettings()
 
         settings['context'] = 'context_without_wrapper_script'
 
@@ -112,8 +115,7 @@ class RunTestSuiteTestCase(unittest.TestCase):
     # -------------------------------------------------------------------------
     def test05_runTestSuite_raises_SystemExit_on_child_proc_exit_code_bigger_than_zero(self):
 
-        settings = vfxtest.collectSettings()
-        vfxtest.prepareTestEnvironment(settings)
+        settings = self._preparedSettings()
 
         settings['context'] = 'python3.x'
         settings['debug_mode'] = True
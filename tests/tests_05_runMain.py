@@ -3,6 +3,7 @@
 # Copyright (c) 2019-2022, Martin Chatterjee. All rights reserved.
 # -----------------------------------------------------------------------------
 
+import copy
 import unittest
 import os
 import sys
@@ -17,6 +18,8 @@ from output_trap import OutputTrap
 # -----------------------------------------------------------------------------
 class RunMainTestCase(unittest.TestCase):
 
+    _default_settings = None
+
     # -------------------------------------------------------------------------
     @classmethod
     def setUpClass(cls):
@@ -25,24 +28,26 @@ class RunMainTestCase(unittest.TestCase):
         cls.init_target = '{}/test_sandbox/init'.format(os.getcwd().replace('\\', '/'))
         if not os.path.exists(cls.init_target):
             os.makedirs(cls.init_target)
+        # enter the sandbox once per class instead of once per test
+        cls.cwd = os.getcwd()
+        os.chdir('./test_sandbox')
 
     # -------------------------------------------------------------------------
     @classmethod
-    def tearDownClass(cls):
-        """
-        """
-    # -------------------------------------------------------------------------
-    def setUp(self):
+    def _defaultSettings(cls):
+        """Collect the default settings once per class, then hand out
+        deep copies instead of re-parsing argv and cfg per test.
         """
-        """
-        self.cwd = os.getcwd()
-        os.chdir('./test_sandbox')
+        if cls._default_settings is None:
+            cls._default_settings = vfxtest.collectSettings()
+        return copy.deepcopy(cls._default_settings)
+
     # -------------------------------------------------------------------------
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """
         """
-        os.chdir(self.cwd)
-
+        os.chdir(cls.cwd)
 
     # -------------------------------------------------------------------------
     def test01_runMain_filtered_works_as_expected(self):
@@ -84,7 +89,7 @@ class RunMainTestCase(unittest.TestCase):
     # -------------------------------------------------------------------------
     def test05_initContext_recognizes_and_initializes_mayapy_session(self):
 
-        settings = vfxtest.collectSettings()
+        settings = self._defaultSettings()
         settings['context'] = 'mayapy'
 
         with mock.patch.dict(sys.modules, {'maya': mock.Mock()}):
@@ -94,7 +99,7 @@ class RunMainTestCase(unittest.TestCase):
     # -------------------------------------------------------------------------
     def test06_initContext_logs_ands_swallows_any_exception(self):
 
-        settings = vfxtest.collectSettings()
+        settings = self._defaultSettings()
         settings['context'] = 'mayapy'
 
         vfxtest.initContext(settings)
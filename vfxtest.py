@@ -25,28 +25,39 @@ provides you with combined code coverage metrics for all of them.
 """
 
 import argparse
+from collections import deque
 import copy
-from fnmatch import fnmatch
+from concurrent.futures import (as_completed,
+                                ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+import fnmatch
+import functools
 import glob
-import importlib
-import inspect
 import json
 import logging
 import os
-import platform
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import traceback
 import unittest
-from six import add_metaclass
+import uuid
 
-try:
-    import unittest.mock as mock
-except ImportError: # pragma: no cover_3
-    import mock
+import unittest.mock as mock
 
-import coverage
+try: # pragma: no cover
+    import orjson
+
+    def _jsonDumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+    _jsonLoads = orjson.loads
+except ImportError:
+    _jsonDumps = functools.partial(json.dumps, separators=(',', ':'))
+    _jsonLoads = json.loads
 
 __version__ = '0.2.2'
 
@@ -55,6 +66,38 @@ main = unittest.main
 logger = logging.getLogger('vfxtest')
 """vfxtest logger"""
 
+_HEADER_BAR = '-' * 70
+
+_COMMENT_RE = re.compile(r'#[^\n]*')
+"""Matches a '#' comment up to the end of its line."""
+
+_LINE_RE = re.compile(r'line (\d+)')
+"""Matches the line number in a JSON decode error message."""
+
+_STDOUT_LOCK = threading.Lock()
+"""Keeps forwarded subprocess output line-atomic across parallel contexts."""
+
+_STATS_OPEN = b'<vfxtest-stats>'
+"""Byte marker that opens an encoded stats payload on STDOUT."""
+
+_SIMPLE_TOKEN_RE = re.compile(r'^\*[^*?[\]]+\*$')
+"""Matches '*token*' filter patterns that plain substring checks can serve."""
+
+_BOOL_MAP = {
+    'true': True,
+    '1': True,
+    'y': True,
+    'yes': True,
+    'false': False,
+    '0': False,
+    'n': False,
+    'no': False,
+}
+"""All recognized boolean string values."""
+
+_TESTCASE_SIG = ('vfxtest', 'TestCase')
+"""Identity of the vfxtest.TestCase class across subprocess boundaries."""
+
 # -----------------------------------------------------------------------------
 def initLogging(level=logging.INFO,
                 format='%(message)s'):
@@ -136,8 +179,7 @@ def collectSettings(args=[]):
         (SystemExit)    :   on missing or incompatible settings or arguments
 
     """
-    arg_parser = _defineArguments()
-    settings = _compileSettings(arg_parser, args)
+    settings = _compileSettings(_ARG_PARSER, args)
 
     return settings
 
@@ -220,26 +262,60 @@ def runNative(settings, report=True, use_coverage=True):
     runner = TextTestRunner(failfast=settings['failfast'],
                             buffer=False)
 
-    # run tests file by file
-    files_run_offset = settings['files_run'] * -1
-    for item in suite:
-        if (settings['globallimit'] > 0 and
-                settings['files_run'] >= settings['globallimit']):
-            logger.info('Reached global file limit... Stopping here...')
-            break
-        if (settings['limit'] > 0 and
-                (settings['files_run'] + files_run_offset) >= settings['limit']):
-            logger.info('Reached file limit per context... Stopping here...')
-            break
+    # Without file limits we can amortize the per-run overhead, either
+    # across worker processes or by running whole batches of test files
+    # at once. Failfast stays supported in the parallel path (shards
+    # stop at their first error and no new shards get dispatched), but
+    # forces the serial path to run file by file to keep its accounting
+    # exact.
+    ran_in_parallel = False
+    no_limits = (settings['limit'] == 0 and settings['globallimit'] == 0)
+    if no_limits:
+        items = list(suite)
+        max_parallel = settings.get('max_parallel_files', 1)
+        if (max_parallel > 1 and
+                settings['context'] == 'native' and
+                len(items) > 1 and
+                sys.platform != 'win32'):
+            _runNativeInParallel(settings, items, max_parallel,
+                                 use_coverage=use_coverage)
+            ran_in_parallel = True
+
+    if (not ran_in_parallel and
+            no_limits and
+            settings['failfast'] is False):
+        items = list(suite)
+        batch_size = settings.get('batch_size', 16)
+        for index in range(0, len(items), batch_size):
+            batch = unittest.TestSuite(items[index:index + batch_size])
+            result = runner.run(batch, settings=settings)
+            sys.stderr.flush()
+
+            settings['files_run'] += len(batch._tests)
+            settings['tests_run'] += result.testsRun
+            settings['errors'] += (len(result.errors) +
+                                   len(result.failures))
+    elif not ran_in_parallel:
+        # run tests file by file
+        files_run_offset = settings['files_run'] * -1
+        for item in suite:
+            if (settings['globallimit'] > 0 and
+                    settings['files_run'] >= settings['globallimit']):
+                logger.info('Reached global file limit... Stopping here...')
+                break
+            if (settings['limit'] > 0 and
+                    (settings['files_run'] + files_run_offset) >= settings['limit']):
+                logger.info('Reached file limit per context... Stopping here...')
+                break
 
-        result = runner.run(item, settings=settings)
-        sys.stderr.flush()
+            result = runner.run(item, settings=settings)
+            sys.stderr.flush()
 
-        settings['files_run'] += 1
-        settings['tests_run'] += result.testsRun
-        settings['errors'] += len(result.errors) + len(result.failures)
-        if settings['failfast'] is True and settings['errors'] > 0:
-            break
+            settings['files_run'] += 1
+            settings['tests_run'] += result.testsRun
+            settings['errors'] += len(result.errors) + len(result.failures)
+            if settings['failfast'] is True and settings['errors'] > 0:
+                break
 
     # --> can't be covered:
     #     coverage does not work inside of another coverage run
@@ -247,12 +323,110 @@ def runNative(settings, report=True, use_coverage=True):
         report_here = not settings['subprocess']
         if settings['tests_run'] == 0:
             report_here = False
+        # pool workers track their own coverage, so the parent's report
+        # would be misleading - combineCoverages() picks the data up later
+        if ran_in_parallel:
+            report_here = False
         _stopCoverage(settings, cov, report=report_here)
 
     if settings['context'] != 'native':
         encodeStatsIntoStdout(settings)
 
 
+# -----------------------------------------------------------------------------
+def _runNativeInParallel(settings, items, max_parallel, use_coverage=True):
+    """Runs the discovered test files in a pool of worker processes.
+
+    Opt-in via the 'max_parallel_files' setting. Whole test modules get
+    sharded round-robin across the workers. Each worker tracks its own
+    coverage under a per-process data suffix, which combineCoverages()
+    picks up later on.
+
+    Failfast gets honored at shard granularity: each worker stops at
+    its first error, and once one shard reports errors no further
+    shards get dispatched (shards already running finish on their own).
+
+    Args:
+        settings (dict)     :  dictionary holding all our settings
+        items (list)        :  per-file test suites discovered in 'target'
+        max_parallel (int)  :  maximum number of worker processes
+        use_coverage (bool) :  workers will track coverage if True.
+                               (default: True)
+
+    """
+    module_names = []
+    for item in items:
+        stack = deque([item])
+        while stack:
+            node = stack.popleft()
+            if isinstance(node, unittest.TestCase):
+                module_names.append(type(node).__module__)
+                break
+            stack.extend(node)
+
+    workers = min(max_parallel, len(module_names))
+    shards = [module_names[index::workers] for index in range(workers)]
+    serialized = _jsonDumps(settings)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_runNativeShard, serialized, shard,
+                                   use_coverage)
+                   for shard in shards]
+        for future in as_completed(futures):
+            files_run, tests_run, errors = future.result()
+            settings['files_run'] += files_run
+            settings['tests_run'] += tests_run
+            settings['errors'] += errors
+            if settings['failfast'] is True and settings['errors'] > 0:
+                for pending in futures:
+                    pending.cancel()
+                break
+
+
+# -----------------------------------------------------------------------------
+def _runNativeShard(serialized_settings, module_names, use_coverage=True):
+    """Runs one shard of test modules inside a pool worker process.
+
+    Args:
+        serialized_settings (string) :  JSON-serialized settings dictionary
+        module_names (list)          :  names of the test modules to run
+        use_coverage (bool)          :  will track coverage if True.
+                                        (default: True)
+
+    Returns:
+        (tuple)                      :  (files_run, tests_run, errors)
+
+    """
+    settings = _jsonLoads(serialized_settings)
+    if settings['target'] not in sys.path:
+        sys.path.insert(0, settings['target'])
+
+    if use_coverage:
+        data_suffix = '{}.{}'.format(settings['context'], os.getpid())
+        cov = _startCoverage(settings, data_suffix=data_suffix)
+
+    files_run = 0
+    tests_run = 0
+    errors = 0
+    failfast = settings['failfast']
+    runner = TextTestRunner(failfast=failfast, buffer=True)
+    for name in module_names:
+        suite = unittest.defaultTestLoader.loadTestsFromName(name)
+        result = runner.run(suite, settings=settings)
+        files_run += 1
+        tests_run += result.testsRun
+        errors += len(result.errors) + len(result.failures)
+        if failfast is True and errors > 0:
+            break
+
+    if use_coverage:
+        cov.stop()
+        if tests_run > 0:
+            cov.save()
+
+    return (files_run, tests_run, errors)
+
+
 # -----------------------------------------------------------------------------
 def runInSubprocess(settings, context):
     """Runs the test suite for context in a spawned subprocess using the
@@ -265,28 +439,31 @@ def runInSubprocess(settings, context):
         (SystemExit)        : if subprocess return an errorcode != 0
 
     """
-    # start with copy of settings, update context
-    ctxt_settings = copy.deepcopy(settings)
+    # start with shallow copy of settings, update context
+    # (only top-level keys get written, nested dicts like
+    # 'context_details' are never mutated per context)
+    ctxt_settings = settings.copy()
     ctxt_settings['context'] = context
 
     executable = _getExecutable(ctxt_settings)
     env = _preparePatchedEnvironment(ctxt_settings, executable, context)
     args = [executable, ]
     is_maya = False
-    if context.lower().find('mayapy') != -1:
+    lc_context = context.lower()
+    if 'mayapy' in lc_context:
         args.append('-m')
         args.append('vfxtest')
 
-    elif context.lower().find('maya') != -1:
+    elif 'maya' in lc_context:
         is_maya = True
         args.append('-command')
         args.append('source vfxtest_maya; vfxtestSchedule();')
 
-    elif context.lower().find('hython') != -1:
+    elif 'hython' in lc_context:
         args.append('-m')
         args.append('vfxtest')
 
-    elif context.lower().find('houdini') != -1:
+    elif 'houdini' in lc_context:
         dcc_settings = settings['dcc_settings_path']
         hou_helper = '{}/helpers/vfxtest_houdini.py'.format(dcc_settings)
         args.append(hou_helper)
@@ -295,53 +472,75 @@ def runInSubprocess(settings, context):
         args.append('-m')
         args.append('vfxtest')
 
-    logger.info('')
-    logger.info('/'*80)
     status_line = ("// Running tests in './{}' as a subprocess (context '{}'): "
                    .format(os.path.basename(settings['target']), context))
     status_line += '/'*(80-len(status_line))
-    logger.info(status_line)
-    logger.info('')
+    logger.info('\n{}\n{}\n'.format('/'*80, status_line))
     sys.stdout.flush()
 
     if settings['debug_mode']:
-        logger.info('')
-        logger.info('[DBG] target folder:')
-        logger.info('      -------------')
-        logger.info('      ' + ctxt_settings['target'])
-        logger.info('')
-        logger.info('[DBG] target context:')
-        logger.info('      --------------')
-        logger.info('      ' + ctxt_settings['context'])
-        logger.info('')
-        logger.info('')
+        logger.info('\n'.join([
+            '',
+            '[DBG] target folder:',
+            '      -------------',
+            '      ' + ctxt_settings['target'],
+            '',
+            '[DBG] target context:',
+            '      --------------',
+            '      ' + ctxt_settings['context'],
+            '',
+            '',
+        ]))
         sys.stdout.flush()
 
-    Popen = _resolvePopenClass()
-    with Popen(args=args,
-               bufsize=0,
-               shell=True,
-               stdout=subprocess.PIPE,
-               stderr=subprocess.STDOUT,
-               env=env) as proc:
-        sys.stdout.flush()
-        while True:
-            line = proc.stdout.readline()
-            if not line:
-                break
-            if not _updateStatsFromStdout(settings, line):
-                sys.stdout.write(str(line))
-                sys.stdout.flush()
-        returncode = proc.wait()
+    try:
+        with subprocess.Popen(args=args,
+                              bufsize=-1,
+                              shell=False,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT,
+                              env=env) as proc:
+            sys.stdout.flush()
+            # drain the pipe in large chunks instead of line by line,
+            # forwarding all completed non-stats lines in one write per chunk
+            fd = proc.stdout.fileno()
+            tail = b''
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                tail += chunk
+                lines = tail.split(b'\n')
+                tail = lines.pop()
+                forward = [line for line in lines
+                           if not _updateStatsFromStdout(settings, line)]
+                if forward:
+                    output = b'\n'.join(forward) + b'\n'
+                    with _STDOUT_LOCK:
+                        sys.stdout.write(output.decode('utf-8',
+                                                       errors='replace'))
+                        sys.stdout.flush()
+            if tail and not _updateStatsFromStdout(settings, tail):
+                with _STDOUT_LOCK:
+                    sys.stdout.write(tail.decode('utf-8', errors='replace'))
+                    sys.stdout.flush()
+            returncode = proc.wait()
+    except OSError as e:
+        logger.error("Failed to launch executable for context '{}': {}"
+                      .format(context, e))
+        raise(SystemExit)
+    finally:
+        # The child consumes the payload at startup and we waited for it
+        # to exit, so the parent can always clean up here — including
+        # when the launch fails or the child dies before reading it.
+        try:
+            os.unlink(env['vfxtest_settings_path'])
+        except OSError:
+            pass
 
     if settings['debug_mode']:
-        logger.info('')
-        logger.info('[DBG] --> Process Return Code: {}'
-                     .format(returncode))
-        logger.info('')
-        logger.info('')
-        logger.info ('/'*80)
-        logger.info('')
+        logger.info('\n[DBG] --> Process Return Code: {}\n\n\n{}\n'
+                     .format(returncode, '/'*80))
         sys.stdout.flush()
 
 
@@ -365,6 +564,12 @@ def runChildTestSuites(settings):
     Every subfolder of 'target' that is named like a known context gets
     run.
 
+    If the 'max_parallel_contexts' setting is bigger than 1 the child
+    test suites get dispatched concurrently, since every context runs
+    in its own independent subprocess anyways.
+    (Running with 'limit' or 'globallimit' always falls back to serial
+    execution, as those limits count across contexts.)
+
     Args:
         settings (dict)     :  dictionary holding all our settings
 
@@ -372,30 +577,81 @@ def runChildTestSuites(settings):
         (Exception)         : any internal exception will be re-raised
 
     """
-    child_settings = settings.copy()
-    target = child_settings['target']
+    target = settings['target']
+
+    # scandir reuses the stat info gathered during enumeration,
+    # so no extra isdir() stat call is needed per entry
+    known_contexts = frozenset(settings['context_details'])
+    child_targets = []
+    with os.scandir(target) as entries:
+        for entry in entries:
+            if entry.name in known_contexts and entry.is_dir():
+                child_targets.append((entry.name, entry.path))
 
     # run child test suites in alphabetical order, but do 'Python' first
-    def sort_python_first(item):
-        if item.lower().startswith('python'):
-            return 0
-        return 1
-    children = sorted(os.listdir(target))
-    children = sorted(children, key=sort_python_first)
-
-    for item in children:
-        if item in child_settings['context_details']:
-            item_path = '{}{}{}'.format(target, os.sep, item)
-            if os.path.isdir(item_path):
-                child_settings['target'] = item_path
-                child_settings['context'] = item
-                runTestSuite(child_settings)
+    def sort_python_first(child):
+        return (0 if child[0].lower().startswith('python') else 1, child)
+    child_targets.sort(key=sort_python_first)
+
+    max_parallel = settings.get('max_parallel_contexts', 1)
+    if (max_parallel > 1 and
+            settings['limit'] == 0 and
+            settings['globallimit'] == 0):
+        _runChildTestSuitesInParallel(settings, child_targets, max_parallel)
+        return
+
+    child_settings = settings.copy()
+    for item, item_path in child_targets:
+        child_settings['target'] = item_path
+        child_settings['context'] = item
+        runTestSuite(child_settings)
 
     settings['files_run'] = child_settings['files_run']
     settings['tests_run'] = child_settings['tests_run']
     settings['errors'] = child_settings['errors']
 
 
+# -----------------------------------------------------------------------------
+def _runChildTestSuitesInParallel(settings, child_targets, max_parallel):
+    """Runs every child test suite in its own worker thread.
+
+    Each child gets its own copy of 'settings' with zeroed out stats.
+    At the end all child stats get summed up into 'settings'.
+    Output of concurrently running contexts may interleave line by line.
+
+    Args:
+        settings (dict)       :  dictionary holding all our settings
+        child_targets (list)  :  list of (context, target path) tuples
+        max_parallel (int)    :  maximum number of concurrent contexts
+
+    Raises:
+        (Exception)           : the first exception raised by any child
+
+    """
+    all_child_settings = []
+    futures = []
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        for item, item_path in child_targets:
+            child_settings = settings.copy()
+            child_settings['target'] = item_path
+            child_settings['context'] = item
+            child_settings['files_run'] = 0
+            child_settings['tests_run'] = 0
+            child_settings['errors'] = 0
+            all_child_settings.append(child_settings)
+            futures.append(executor.submit(runTestSuite, child_settings))
+
+    for child_settings in all_child_settings:
+        settings['files_run'] += child_settings['files_run']
+        settings['tests_run'] += child_settings['tests_run']
+        settings['errors'] += child_settings['errors']
+
+    for future in futures:
+        if future.exception() is not None:
+            raise future.exception()
+
+
 # -----------------------------------------------------------------------------
 def combineCoverages(settings):
     """Combines all .coverage files found into on overall coverage data set.
@@ -407,13 +663,30 @@ def combineCoverages(settings):
 
     """
     test_output = settings['output_folder']
-    data_file='{}/.coverage'.format(test_output)
+    # without any per-context data files there is nothing to combine,
+    # so skip the whole Coverage dance (combine would just end up
+    # raising on report)
+    if not glob.glob(os.path.join(test_output, '.coverage.*')):
+        logger.info('Coverage: no data to report')
+        return
+
+    import coverage
+
+    data_file = os.path.join(test_output, '.coverage')
     cov = coverage.Coverage(data_file=data_file)
     cov.combine()
     cov.save()
     try:
-        cov.report()
-        cov.html_report(directory='{}/_coverage_html'.format(test_output))
+        # The HTML report is the slow step and is independent of the
+        # textual report, so render it in the background while the
+        # textual report prints to STDOUT.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            html_future = executor.submit(
+                            cov.html_report,
+                            directory=os.path.join(test_output,
+                                                   '_coverage_html'))
+            cov.report()
+            html_future.result()
     except coverage.misc.CoverageException as e:
         logger.info('Coverage Exception: {}'.format(e))
         logger.info(traceback.format_exc())
@@ -431,7 +704,7 @@ def encodeStatsIntoStdout(settings):
 
     """
     stats = getStats(settings)
-    encoded = '<vfxtest-stats>{}</vfxtest-stats>'.format(json.dumps(stats))
+    encoded = '<vfxtest-stats>{}</vfxtest-stats>'.format(_jsonDumps(stats))
 
     stdout = sys.stdout
     # let Maya write the stats to the _external_ stdout
@@ -439,9 +712,9 @@ def encodeStatsIntoStdout(settings):
     if settings['context'].lower() == 'maya':
         stdout = sys.__stdout__ # pragma: no cover
 
-    stdout.write('')
-    stdout.write(encoded)
-    stdout.write('')
+    # one write, framed by newlines, so the stats payload is guaranteed
+    # to arrive in the parent as a clean line of its own
+    stdout.write('\n{}\n'.format(encoded))
     stdout.flush()
 
 
@@ -523,7 +796,7 @@ def createSampleConfig(settings):
         logger.error("'target' folder not accessible: {}".format(settings['target']))
         raise SystemExit
 
-    config_path = '{}/.config'.format(settings['target'], )
+    config_path = os.path.join(settings['target'], '.config')
     if os.path.exists(config_path):
         logger.error("config already exists: {}".format(config_path))
         raise SystemExit
@@ -580,11 +853,19 @@ def __stringToBool(value):
                                        as a boolean value
 
     """
-    if value.lower() in ('true', '1', 'y', 'yes'):
-        return True
-    if value.lower() in ('false', '0', 'n', 'no'):
-        return False
-    raise argparse.ArgumentTypeError('Boolean value expected.')
+    result = _BOOL_MAP.get(value.lower())
+    if result is None:
+        raise argparse.ArgumentTypeError('Boolean value expected.')
+    return result
+
+
+_ARG_PARSER = _defineArguments()
+"""Shared ArgumentParser instance.
+
+The argument schema is static, so the parser gets built only once at
+import time. '_defineArguments' stays available as a factory for a
+fresh parser.
+"""
 
 
 # -----------------------------------------------------------------------------
@@ -617,7 +898,8 @@ def _compileSettings(arg_parser, args):
         # start with arguments
         settings = vars(arg_parser.parse_args(args=args))
         # use settings in environment if present, fall back to cfg file
-        if 'vfxtest_settings' in os.environ:
+        if ('vfxtest_settings' in os.environ or
+                'vfxtest_settings_path' in os.environ):
             _recoverSettingsFromEnv(settings)
         else:
             _readConfig(settings)
@@ -641,7 +923,7 @@ def _updateStatsFromStdout(settings, line):
 
     Args:
         settings (dict) : settings dictionary
-        line (string)   : current STDOUT line to parse
+        line (bytes)    : current STDOUT line to parse
 
     Returns:
         (bool)          : True if stats got found, False if not
@@ -649,20 +931,24 @@ def _updateStatsFromStdout(settings, line):
     """
     status = False
 
+    # common path: no stats marker in this line, so skip the decode
+    if _STATS_OPEN not in line:
+        return status
+
     line = line.decode('utf-8', errors="replace")
 
-    tokens = line.split('<vfxtest-stats>')
-    if len(tokens) > 1:
-        stats = tokens[1].split('</vfxtest-stats>')[0]
-        try:
-            decoded = json.loads(stats)
-        except (ValueError): # pragma: no cover
-            pass
-        else:
-            settings['files_run'] = decoded['files_run']
-            settings['tests_run'] = decoded['tests_run']
-            settings['errors'] = decoded['errors']
-            status = True
+    start = line.index('<vfxtest-stats>') + len('<vfxtest-stats>')
+    end = line.find('</vfxtest-stats>', start)
+    stats = line[start:end] if end != -1 else line[start:]
+    try:
+        decoded = _jsonLoads(stats)
+    except (ValueError): # pragma: no cover
+        pass
+    else:
+        settings['files_run'] = decoded['files_run']
+        settings['tests_run'] = decoded['tests_run']
+        settings['errors'] = decoded['errors']
+        status = True
 
     return status
 
@@ -718,11 +1004,21 @@ def _preparePatchedEnvironment(settings, executable, context):
     """
     env = dict(os.environ)
 
-    # store updated copy fo settings in environment variable
-    json_settings = json.dumps(settings)
-    env['vfxtest_settings'] = json_settings
+    # Store an updated copy of the settings in a payload file and pass only
+    # its path down in the environment. This keeps the environment block
+    # small (Windows caps it at 32 KiB and copies it on every spawn).
+    json_settings = _jsonDumps(settings)
+    payload = tempfile.NamedTemporaryFile(mode='w',
+                                          dir=settings['output_folder'],
+                                          prefix='.vfxtest_settings.',
+                                          suffix='.json',
+                                          delete=False)
+    with payload:
+        payload.write(json_settings)
+    env['vfxtest_settings_path'] = payload.name
+    env.pop('vfxtest_settings', None)
     dcc_settings = settings['dcc_settings_path']
-    cwd = os.path.abspath(settings['cwd']).replace('\\', '/')
+    cwd = _normPath(settings['cwd'])
 
     # Assemble PYTHONPATH.
     settings_pythonpath = os.path.join(dcc_settings, 'PYTHONPATH')
@@ -766,7 +1062,8 @@ def _preparePatchedEnvironment(settings, executable, context):
 
     # deal with maya contexts
     context = settings.get('context', '')
-    if context.lower().find('maya') != -1:
+    lc_context = context.lower()
+    if 'maya' in lc_context:
         maya_version = settings['context_details'][context].get('version', '')
         env['MAYA_APP_DIR'] = '{}/{}.vfxtest.{}'.format(dcc_settings,
                                                         context,
@@ -778,7 +1075,7 @@ def _preparePatchedEnvironment(settings, executable, context):
         env.pop('MAYA_MODULE_PATH', None)
 
     # deal with houdini/hython context
-    if (context.lower().find('hython') != -1 or context.lower().find('houdini') != -1):
+    if 'hython' in lc_context or 'houdini' in lc_context:
         env['HOUDINI_USER_PREF_DIR'] = '{}/houdini.vfxtest.__HVER__'.format(dcc_settings)
         env.pop('HSITE', None)
 
@@ -806,8 +1103,8 @@ def _getExecutable(settings):
     # if this is standalone python then prefer the correct virtualenv
     if context.lower().find('python') != -1:
         dcc_settings = settings['dcc_settings_path']
-        venv_root = os.sep.join([dcc_settings, 'virtualenv_{}'.format(context)])
-        venv_root = venv_root.replace('\\', '/')
+        venv_root = _normPath(
+            os.path.join(dcc_settings, 'virtualenv_{}'.format(context)))
         if os.path.exists(venv_root):
             subfolder = 'bin'
             if sys.platform == 'win32':
@@ -819,12 +1116,33 @@ def _getExecutable(settings):
 
 
 # -----------------------------------------------------------------------------
+def _normPath(path):
+    """Returns 'path' as an absolute path with forward slashes.
+
+    Paths stored in settings follow this forward-slash invariant, so
+    downstream code never needs to re-normalize them.
+
+    Args:
+        path (string) : path to normalize
+
+    Returns:
+        (string)      : absolute forward-slash path
+
+    """
+    return os.path.abspath(path).replace('\\', '/')
+
+
+# -----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def _getPathToMyself():
     """Return absolute path of this file.
 
+    The result can never change during the lifetime of a process,
+    therefore it gets computed only once.
+
     """
     # for Python 2 and 3 compatibility we need to ensure a .py suffix
-    my_path = os.path.abspath(__file__).replace('\\', '/')
+    my_path = _normPath(__file__)
     my_path = my_path.replace('.pyc', '.py')
     return my_path
 
@@ -851,13 +1169,19 @@ def _discoverTests(settings):
 
 
 # -----------------------------------------------------------------------------
-def _startCoverage(settings):
+def _startCoverage(settings, data_suffix=None):
     """Start the code coverage.
 
     Args:
-        settings (dict) : settings dictionary
+        settings (dict)      : settings dictionary
+        data_suffix (string) : overrides the coverage data suffix, which
+                               defaults to the current context.
+                               (Optional, defaults to None)
 
     """
+    # deferred import - runs with use_coverage=False never pay for it
+    import coverage
+
     omit = []
     # omit myself
     omit.append('*vfxtest.py')
@@ -895,10 +1219,10 @@ def _startCoverage(settings):
         test_file_pattern = prefix + settings['test_file_pattern']
         omit.append(test_file_pattern)
 
-    data_file='{}/.coverage'.format(settings['output_folder'])
+    data_file = os.path.join(settings['output_folder'], '.coverage')
     cov = coverage.Coverage(omit=omit,
                             data_file=data_file,
-                            data_suffix=settings['context'])
+                            data_suffix=data_suffix or settings['context'])
     cov.start()
     # --> can't be covered:
     #     coverage does not work inside of another coverage run
@@ -929,18 +1253,30 @@ def _stopCoverage(settings, cov, report=True): # pragma: no cover
 
 # -----------------------------------------------------------------------------
 def _recoverSettingsFromEnv(settings):
-    """Recovers settings from the environment variable 'vfxtest_settings'
+    """Recovers settings passed down from a parent vfxtest process
     and replaces the contents of the settings dictionary accordingly.
 
-    This environment variable gets used to pass down settings into a
-    vfxtest subprocess.
+    Prefers the payload file referenced by the 'vfxtest_settings_path'
+    environment variable (which gets consumed and removed), but also
+    accepts settings serialized directly into 'vfxtest_settings'.
 
     Args:
         settings (dict) : settings dictionary
 
     """
-    serialized = os.environ['vfxtest_settings']
-    recovered_settings = json.loads(serialized)
+    payload_path = os.environ.pop('vfxtest_settings_path', None)
+    if payload_path is not None:
+        with open(payload_path, 'r') as f:
+            serialized = f.read()
+        # best-effort removal - the parent reliably cleans up after the
+        # child process has exited
+        try:
+            os.unlink(payload_path)
+        except OSError: # pragma: no cover
+            pass
+    else:
+        serialized = os.environ['vfxtest_settings']
+    recovered_settings = _jsonLoads(serialized)
     settings.clear()
     settings.update(recovered_settings)
 
@@ -983,21 +1319,20 @@ def _readConfig(settings):
     if os.path.exists(settings['cfg']):
         with open(settings['cfg'], 'r') as f:
             content = f.read()
-        # strip comments and empty lines
-        lines = []
-        for line in content.split('\n'):
-            tokens = line.split('#')
-            relevant = tokens[0]
-            if len(relevant.strip()) > 0:
-                lines.append(relevant)
+        # strip comments in one single pass, keeping all line breaks
+        # intact so that error line numbers still match the file
+        # (configs without a single '#' skip the regex pass entirely)
+        if '#' in content:
+            json_string = _COMMENT_RE.sub('', content)
+        else:
+            json_string = content
         try:
             # interpret as json and add to settings
-            json_string = '\n'.join(lines)
-            cfg = json.loads(json_string)
+            cfg = _parseConfigContent(json_string)
         except Exception as e:
         # except ValueError as e:  --> Python 2.7
         # except json.decoder.JSONDecodeError as e:  --> Python 3.7
-            _logJsonError(settings['cfg'], e, lines)
+            _logJsonError(settings['cfg'], e, json_string.split('\n'))
             raise
         settings.update(cfg)
 
@@ -1007,6 +1342,40 @@ def _readConfig(settings):
             raise IOError('Config file does not exist: {}'.format(settings['cfg']))
 
 
+# -----------------------------------------------------------------------------
+def _parseConfigContent(json_string):
+    """Parses comment-stripped config content into a dict.
+
+    Memoized on the content itself, so repeated collectSettings() calls
+    against an unchanged cfg only pay for the JSON parse once per process.
+    Every caller receives its own deep copy, since settings dicts get
+    mutated freely downstream.
+
+    Args:
+        json_string (string) : cfg content with comments stripped
+
+    Returns:
+        (dict)               : parsed config
+
+    """
+    return copy.deepcopy(_parseConfigContentCached(json_string))
+
+
+# -----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=8)
+def _parseConfigContentCached(json_string):
+    """Performs the actual JSON parse, cached per unique cfg content.
+
+    Args:
+        json_string (string) : cfg content with comments stripped
+
+    Returns:
+        (dict)               : parsed config (shared, do not mutate)
+
+    """
+    return _jsonLoads(json_string)
+
+
 # -----------------------------------------------------------------------------
 def _ensureDefaultSettings(settings):
     """Ensures sensible default settings.
@@ -1022,10 +1391,14 @@ def _ensureDefaultSettings(settings):
         settings['test_file_pattern'] = 'test*.py'
     if not 'output_folder' in settings:
         settings['output_folder'] = './.output'
+    if not 'max_parallel_contexts' in settings:
+        settings['max_parallel_contexts'] = 1
+    if not 'max_parallel_files' in settings:
+        settings['max_parallel_files'] = 1
 
     if not 'debug_mode' in settings:
         settings['debug_mode'] = False
-    if '{}'.format(settings['debug_mode']).lower() == 'true':
+    if str(settings['debug_mode']).lower() == 'true':
         settings['debug_mode'] = True
     if not settings['debug_mode'] == True:
         settings['debug_mode'] = False
@@ -1048,13 +1421,13 @@ def _ensureDefaultSettings(settings):
     for key in ['cfg', 'target']:
         settings[key] = os.path.abspath(settings[key])
     # make test_output absolute in relation to config location
-    stored_wd = os.getcwd()
-    try:
-        os.chdir(os.path.dirname(settings['cfg']))
-        settings['output_folder'] = os.path.abspath(settings['output_folder'])
-        settings['output_folder'] = settings['output_folder'].replace('\\', '/')
-    finally:
-        os.chdir(stored_wd)
+    # (resolved by path arithmetic - chdir would be process-global and
+    # therefore hostile to the parallel dispatch paths)
+    output_folder = settings['output_folder']
+    if not os.path.isabs(output_folder):
+        output_folder = os.path.join(os.path.dirname(settings['cfg']),
+                                     output_folder)
+    settings['output_folder'] = _normPath(output_folder)
 
 
 # -----------------------------------------------------------------------------
@@ -1070,26 +1443,29 @@ def _logJsonError(cfg_path, e, lines):
     """
     offending_line_nbr = _extractLineNumber(e)
 
-    logger.error('')
-    logger.error('')
-    logger.error('='*80)
-    logger.error('= cfg Error ' + ('='*68))
-    logger.error('')
-    logger.error('This cfg file does not contain valid JSON:')
-    logger.error("       '{}'".format(cfg_path))
-    logger.error('')
-    logger.error("Error in line {}: '{}'".format(offending_line_nbr, e))
-    logger.error('')
-    logger.error('Faulty JSON (after stripping comments):')
-    logger.error('---------------------------------------')
-    logger.error('')
+    # build the whole report in one buffer and emit it in a single go,
+    # instead of paying for one logging call per source line
+    buf = []
+    buf.append('')
+    buf.append('')
+    buf.append('='*80)
+    buf.append('= cfg Error ' + ('='*68))
+    buf.append('')
+    buf.append('This cfg file does not contain valid JSON:')
+    buf.append("       '{}'".format(cfg_path))
+    buf.append('')
+    buf.append("Error in line {}: '{}'".format(offending_line_nbr, e))
+    buf.append('')
+    buf.append('Faulty JSON (after stripping comments):')
+    buf.append('---------------------------------------')
+    buf.append('')
     for index, line in enumerate(lines):
         lineno = index+1
-        source_line = '{}  {}'.format(str(lineno).rjust(3), line)
-        logger.error(source_line)
-    logger.error('')
-    logger.error('='*80)
-    logger.error('')
+        buf.append('{}  {}'.format(str(lineno).rjust(3), line))
+    buf.append('')
+    buf.append('='*80)
+    buf.append('')
+    logger.error('\n'.join(buf))
 
 
 # -----------------------------------------------------------------------------
@@ -1103,18 +1479,15 @@ def _extractLineNumber(e):
         (int)   : offending line number, or -1
 
     """
-    line_nbr = -1
-    try:
-        right_side = str(e).split('line ')[1]
-        number = right_side.split(' ')[0]
-        line_nbr = int(number)
-    except Exception as e:
-        pass
-    return line_nbr
+    match = _LINE_RE.search(str(e))
+    if match:
+        return int(match.group(1))
+    return -1
 
 
 # -------------------------------------------------------------------------
-def _createTestRootFolder(settings, name, reuse_existing=False):
+def _createTestRootFolder(settings, name, reuse_existing=False,
+                          validate_output=True):
     """Creates a sandboxed test_root folder inside the 'output_folder'
     folder specified in 'settings'. The name of the test_root folder
     will match the name of the TestCase.
@@ -1125,8 +1498,14 @@ def _createTestRootFolder(settings, name, reuse_existing=False):
     However if the output folder does not exist it will raise an OSError.
 
     Args:
-        settings (dict)      :  dictionary holding all our settings
-        name (string)        :  name of the test root folder to create.
+        settings (dict)        :  dictionary holding all our settings
+        name (string)          :  name of the test root folder to create.
+        reuse_existing (bool)  :  will keep an already existing folder
+                                  as is, if True. (default: False)
+        validate_output (bool) :  will verify that the output folder
+                                  exists, if True. Callers that already
+                                  validated it may skip this check.
+                                  (default: True)
 
     Returns:
         (string)        :  absolute path of test_root
@@ -1136,16 +1515,25 @@ def _createTestRootFolder(settings, name, reuse_existing=False):
 
     """
     test_output = settings.get('output_folder', None)
-    if not os.path.exists(test_output):
+    if validate_output and not os.path.exists(test_output):
         raise OSError("Invalid test_output: {}".format(test_output))
 
-    testsuite_root = '{}{}{}'.format(test_output,
-                                     os.sep,
-                                     name)
-    if os.path.exists(testsuite_root) and not reuse_existing:
-       shutil.rmtree(testsuite_root)
-    if not os.path.exists(testsuite_root):
-        os.makedirs(testsuite_root)
+    testsuite_root = os.path.join(test_output, name)
+    if not reuse_existing and os.path.exists(testsuite_root):
+        if sys.platform == 'win32':
+            # stay synchronous on Windows, where renames tend to fail
+            # because of file locks held by AV scans etc.
+            shutil.rmtree(testsuite_root) # pragma: no cover
+        else:
+            # move the old folder out of the way with one atomic rename
+            # and delete it in the background while the tests run
+            trash = '{}.trash.{}'.format(testsuite_root, uuid.uuid4().hex)
+            os.rename(testsuite_root, trash)
+            threading.Thread(target=shutil.rmtree,
+                             args=(trash,),
+                             kwargs={'ignore_errors': True},
+                             daemon=True).start()
+    os.makedirs(testsuite_root, exist_ok=True)
 
     return testsuite_root.replace('\\', '/')
 
@@ -1165,8 +1553,7 @@ def _ensureOutputFolder(settings):
     if not os.path.exists(parent_folder):
         raise SystemExit("Folder does not exist: '{}'"
                           .format(parent_folder))
-    if not os.path.exists(test_output):
-        os.makedirs(test_output)
+    os.makedirs(test_output, exist_ok=True)
 
 
 # -----------------------------------------------------------------------------
@@ -1177,13 +1564,15 @@ def _prepareHelpers(settings):
         settings (dict) : settings dictionary
 
     """
-    helpers = '{}/helpers'.format(settings['dcc_settings_path'])
-    if not os.path.exists(helpers):
-        os.makedirs(helpers)
+    helpers = os.path.join(settings['dcc_settings_path'], 'helpers')
+    os.makedirs(helpers, exist_ok=True)
+
+    # snapshot the folder once instead of stat'ing every helper file
+    existing = {entry.name for entry in os.scandir(helpers)}
 
     _ensureRequirements(helpers)
-    _ensureHoudiniHelper(helpers)
-    _ensureMayaHelper(helpers)
+    _ensureHoudiniHelper(helpers, existing)
+    _ensureMayaHelper(helpers, existing)
 
 
 # -----------------------------------------------------------------------------
@@ -1217,11 +1606,12 @@ def _preparePythonPath(settings):
             settings['vfxtest_py_path'] = vfxtest_py_path
         return
 
-    os.makedirs(pythonpath)
+    os.makedirs(pythonpath, exist_ok=True)
 
-    # copy over vfxtest
+    # copy over vfxtest (plain copyfile takes the zero-copy fast path
+    # and nobody cares about the metadata of this throwaway copy)
     vfxtest_py = _getPathToMyself()
-    shutil.copy2(vfxtest_py, vfxtest_py_path)
+    shutil.copyfile(vfxtest_py, vfxtest_py_path)
 
 
 # -----------------------------------------------------------------------------
@@ -1235,58 +1625,99 @@ def _ensureRequirements(target_path, name='requirements.txt'):
                                (Optional, defaults to requirements.txt)
 
     """
-    file_path = '{}/{}'.format(target_path, name)
+    file_path = os.path.join(target_path, name)
+
+    _writeFileIfChanged(file_path, 'vfxtest=={}\n'.format(__version__))
+
+
+# -----------------------------------------------------------------------------
+def _writeFileIfChanged(file_path, content, compare=True):
+    """Writes 'content' to 'file_path' atomically, skipping the write when
+    the file already holds exactly this content.
+
+    This keeps helper files up to date after upgrades while sparing the
+    disk write (and the Windows AV rescan it triggers) when nothing
+    changed.
+
+    Args:
+        file_path (string) : path of the target file
+        content (string)   : intended file content
+        compare (bool)     : compare against the current file content
+                             first, pass False when the file is known
+                             to be missing.
+                             (Optional, defaults to True)
+
+    """
+    want = content.encode('utf-8')
+
+    if compare:
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read() == want:
+                    return
+        except IOError: # pragma: no cover
+            pass
 
-    with open(file_path, 'w') as f:
-        f.write('vfxtest=={}\n'.format(__version__))
+    tmp_path = '{}.tmp'.format(file_path)
+    with open(tmp_path, 'wb') as f:
+        f.write(want)
+    os.replace(tmp_path, file_path)
 
 
 # -----------------------------------------------------------------------------
-def _ensureMayaHelper(target_path):
+def _ensureMayaHelper(target_path, existing=None):
     """Ensures the Maya Helper MEL script necessary to run tests inside
     an interactive Maya session.
 
     Args:
         target_path (string)   : target folder path
+        existing (set)         : file names already present in the target
+                                 folder, spares the per-file stat call
+                                 (Optional, defaults to None)
 
     """
-    maya_helper = '{}/vfxtest_maya.mel'.format(target_path)
+    if existing is None:
+        existing = {entry.name for entry in os.scandir(target_path)}
 
-    if not os.path.exists(maya_helper):
+    maya_helper = os.path.join(target_path, 'vfxtest_maya.mel')
 
-        code = [
-            'global proc vfxtestSchedule() {',
-            '    string $python = "import vfxtest; vfxtest.mayaScheduleDelayed()";',
-            '    evalDeferred `python $python`;',
-            '}',
-        ]
+    code = [
+        'global proc vfxtestSchedule() {',
+        '    string $python = "import vfxtest; vfxtest.mayaScheduleDelayed()";',
+        '    evalDeferred `python $python`;',
+        '}',
+    ]
 
-        with open(maya_helper, 'w') as f:
-            f.write('\n'.join(code))
+    _writeFileIfChanged(maya_helper, '\n'.join(code),
+                        compare='vfxtest_maya.mel' in existing)
 
 
 # -----------------------------------------------------------------------------
-def _ensureHoudiniHelper(target_path):
+def _ensureHoudiniHelper(target_path, existing=None):
     """Ensures the Houdini Helper Python module necessary to run tests inside
     an interactive Houdini session.
 
     Args:
         target_path (string)   : target folder path
+        existing (set)         : file names already present in the target
+                                 folder, spares the per-file stat call
+                                 (Optional, defaults to None)
 
     """
-    hou_helper = '{}/vfxtest_houdini.py'.format(target_path)
+    if existing is None:
+        existing = {entry.name for entry in os.scandir(target_path)}
 
-    if not os.path.exists(hou_helper):
+    hou_helper = os.path.join(target_path, 'vfxtest_houdini.py')
 
-        code = [
-            "import vfxtest",
-            "",
-            "if __name__ == '__main__':",
-            "    vfxtest.houdiniScheduleDelayed()",
-        ]
+    code = [
+        "import vfxtest",
+        "",
+        "if __name__ == '__main__':",
+        "    vfxtest.houdiniScheduleDelayed()",
+    ]
 
-        with open(hou_helper, 'w') as f:
-            f.write('\n'.join(code))
+    _writeFileIfChanged(hou_helper, '\n'.join(code),
+                        compare='vfxtest_houdini.py' in existing)
 
 
 # -----------------------------------------------------------------------------
@@ -1303,12 +1734,28 @@ def _ensureVirtualEnvs(settings):
 
     """
     virtualenvs = _collectPythonExecutableDetails(settings)
+    dcc_settings_path = settings['dcc_settings_path']
 
-    for venv_path in virtualenvs:
-        if not os.path.exists(venv_path):
-            details = virtualenvs[venv_path]
-            dcc_settings_path = settings['dcc_settings_path']
-            _initializeVirtualEnv(venv_path, details, dcc_settings_path)
+    todo = [(venv_path, details)
+            for venv_path, details in virtualenvs.items()
+            if not os.path.exists(venv_path)]
+    if not todo:
+        return
+
+    if len(todo) == 1:
+        venv_path, details = todo[0]
+        _initializeVirtualEnv(venv_path, details, dcc_settings_path)
+        return
+
+    # each virtualenv setup is dominated by pip network/disk latency and
+    # writes to its own folder, so overlapping them is safe and turns
+    # the total wait from a sum into a max
+    with ThreadPoolExecutor(max_workers=min(8, len(todo))) as executor:
+        futures = [executor.submit(_initializeVirtualEnv,
+                                   venv_path, details, dcc_settings_path)
+                   for venv_path, details in todo]
+        for future in futures:
+            future.result()
 
 
 # -----------------------------------------------------------------------------
@@ -1330,14 +1777,26 @@ def _collectPythonExecutableDetails(settings):
 
     result = {}
 
-    for context in settings['context_details']:
-        if context.lower().find('python') != -1:
-            details = settings['context_details'][context]
-            executable = details.get('executable', '')
-            if os.path.exists(executable):
-                venv_name = 'virtualenv_{}'.format(context)
-                venv_path = '{}/{}'.format(dcc_settings_path, venv_name)
-                result[venv_path] = details
+    # verify each unique parent folder with a single scandir listing
+    # instead of paying one stat call per executable
+    listings = {}
+    for context, details in settings['context_details'].items():
+        if context.lower().find('python') == -1:
+            continue
+        executable = details.get('executable', '')
+        if not executable:
+            continue
+        folder = os.path.dirname(executable)
+        if folder not in listings:
+            try:
+                listings[folder] = {os.path.normcase(entry.name)
+                                    for entry in os.scandir(folder)}
+            except OSError:
+                listings[folder] = frozenset()
+        if os.path.normcase(os.path.basename(executable)) in listings[folder]:
+            venv_name = 'virtualenv_{}'.format(context)
+            venv_path = '{}/{}'.format(dcc_settings_path, venv_name)
+            result[venv_path] = details
 
     return result
 
@@ -1364,55 +1823,48 @@ def _initializeVirtualEnv(venv_path, details, dcc_settings_path):
 
     venv_name = os.path.basename(venv_path)
     subfolder = 'bin'
-    keyword = 'source'
     if sys.platform == 'win32':
         subfolder = 'Scripts'
-        keyword = 'call'
-
-    args = [executable,
-            '-m',
-            'virtualenv',
-            venv_path,
-            '&&',
-            keyword,
-            '{}/{}/activate'.format(venv_path, subfolder),
-            '&&',
-            'pip',
-            'install',
-            '-r',
-            requirements,
-           ]
+    # using the python executable inside the virtualenv directly makes
+    # sourcing the 'activate' script unnecessary
+    venv_python = '{}/{}/{}'.format(venv_path, subfolder, 'python')
+
+    commands = []
+    commands.append([executable, '-m', 'virtualenv', venv_path])
+    commands.append([venv_python, '-m', 'pip', 'install', '-r', requirements])
     # deal with optional requirements file
     if 'requirements' in details:
-        req_path = os.path.abspath(details['requirements']).replace('\\', '/')
+        req_path = _normPath(details['requirements'])
         if os.path.exists(req_path):
-            args.append('&&')
-            args.append('pip')
-            args.append('install')
-            args.append('-r')
-            args.append(req_path)
-    # finaly deactivate the virtualenv straight away
-    args.append('&&')
-    args.append(keyword)
-    args.append('{}/{}/deactivate'.format(venv_path, subfolder))
-
-    Popen = _resolvePopenClass()
+            commands.append([venv_python, '-m', 'pip', 'install', '-r', req_path])
+
     logger.info('')
     logger.info('/'*80)
     logger.info("Initializing virtualenv '{}'".format(venv_name))
 
-    with Popen(args=args,
-               bufsize=0,
-               shell=True,
-               stdout=subprocess.PIPE,
-               stderr=subprocess.STDOUT) as proc:
-        sys.stdout.flush()
-        while True:
-            line = proc.stdout.readline().decode('utf-8')
-            if not line:
-                break
-            sys.stdout.write(line)
-        proc.wait()
+    for args in commands:
+        try:
+            with subprocess.Popen(args=args,
+                                  bufsize=-1,
+                                  shell=False,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT) as proc:
+                sys.stdout.flush()
+                # drain in large chunks - pip output needs no
+                # line-by-line treatment
+                fd = proc.stdout.fileno()
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    sys.stdout.write(chunk.decode('utf-8', errors='replace'))
+                    sys.stdout.flush()
+                if proc.wait() != 0:
+                    break
+        except OSError as e:
+            logger.info("Could not initialize virtualenv '{}': {}"
+                        .format(venv_name, e))
+            break
 
     # Remove 'vfxtest.py' file from virtualenv, if it exists.
     vfxtest_py = os.path.join(venv_path, 'Lib', 'site-packages', 'vfxtest.py')
@@ -1590,50 +2042,40 @@ def houdiniRunDelayed(): # pragma  no cover
 
 
 # -----------------------------------------------------------------------------
-def _resolvePopenClass():
-    """Returns the correct Popen class to use.
+@functools.lru_cache(maxsize=32)
+def _compilePatterns(patterns):
+    """Translates a tuple of glob patterns into compiled regex objects.
 
-    In Python 3.x we use the native subprocess.Popen class, as this can already
-    be used as a Context Manager natively.
+    The first pattern gets compiled on its own. The remaining optional
+    patterns get fused into a single alternation regex - unless all of
+    them are simple '*token*' shapes, in which case plain substring
+    checks do the same job for a fraction of the cost and the regex is
+    skipped entirely.
 
-    For Python 2.x contexts we return our own wrapped PopenWithContextManager
-    class.
+    The result gets cached, so repeated discovery runs with the same
+    patterns only pay the fnmatch translation and regex compile once.
 
-    Returns:
-        (class)     : Popen class to use
-
-    """
-    Popen = subprocess.Popen
-    if not hasattr(Popen, '__enter__'):
-        Popen = PopenWithContextManager  # pragma: no cover_3
-    return Popen
-
-
-# -----------------------------------------------------------------------------
-class PopenWithContextManager(subprocess.Popen): # pragma: no cover_3
-    """A wrapper around subproces.Popen that also is a Context Manager.
+    Args:
+        patterns (tuple)    :  tuple of glob pattern strings
 
-    Python 3.x already supports this out of the box.
-    Therefore we use this in Python 2.x contexts.
+    Returns:
+        (tuple)             :  (first regex,
+                                optionals regex or None,
+                                substring tuple or None)
 
     """
-
-    # -------------------------------------------------------------------------
-    def __enter__(self):
-        return self
-
-    # -------------------------------------------------------------------------
-    def __exit__(self, exc_type, value, traceback):
-        if self.stdout:
-            self.stdout.close()
-        if self.stderr:
-            self.stderr.close()
-        try:  # Flushing a BufferedWriter may raise an error
-            if self.stdin:
-                self.stdin.close()
-        finally:
-            # Wait for the process to terminate, to avoid zombies.
-            self.wait()
+    first = re.compile(fnmatch.translate(os.path.normcase(patterns[0])))
+    optionals = None
+    substrings = None
+    if len(patterns) > 1:
+        if all(_SIMPLE_TOKEN_RE.match(item) for item in patterns[1:]):
+            substrings = tuple(os.path.normcase(item[1:-1])
+                               for item in patterns[1:])
+        else:
+            optionals = re.compile(
+                '|'.join(fnmatch.translate(os.path.normcase(item))
+                         for item in patterns[1:]))
+    return (first, optionals, substrings)
 
 
 # -----------------------------------------------------------------------------
@@ -1662,20 +2104,19 @@ class FilteredTestLoader(unittest.TestLoader):
             pattern (list)   : list of at least one string pattern
 
         """
+        first, optionals, substrings = _compilePatterns(tuple(pattern))
+        path = os.path.normcase(path)
+
         # first pattern must be matched
-        result = False
-        if fnmatch(path, pattern[0]):
-            result = True
-            # at least one of the optional patterns must be matched
-            optionals = pattern[1:]
-            if len(optionals) > 0:
-                result = False
-                for item in optionals:
-                    if fnmatch(path, item):
-                        result = True
-                        break
+        if not first.match(path):
+            return False
+        # at least one of the optional patterns must be matched
+        if substrings is not None:
+            return any(token in path for token in substrings)
+        if optionals is not None:
+            return optionals.match(path) is not None
 
-        return result
+        return True
 
 
 # -----------------------------------------------------------------------------
@@ -1699,79 +2140,55 @@ class TextTestRunner(unittest.TextTestRunner):
     def _prepTestCases(self, test, settings):
         """
         """
-        if isinstance(test, unittest.TestSuite):
-            for item in test._tests:
-                if isinstance(item, unittest.TestCase):
-                    # We can't just do 'isinstance(item, TestCase)' in here
-                    # because this fails for TestTextRunners in child processes.
-                    # Instead we fall back to text comparision of the parent classes.
-                    # Feels a bit dodgy, but works...
-                    base_classes = inspect.getmro(item.__class__)
-                    for bc in base_classes:
-                        if str(bc) == "<class 'vfxtest.TestCase'>":
-                            item.settings = settings
-                            test_case_name = item.__class__.__name__
-                            item.test_root = _createTestRootFolder(settings,
-                                                                   test_case_name)
-                            return
-                elif isinstance(item, unittest.TestSuite):
-                    self._prepTestCases(item, settings)
-
-
-# -----------------------------------------------------------------------------
-class TestCaseType(type):
-    """Metaclass for TestCase.
-
-    Needed to support 'TestCase.test_root'.
-
-    """
-
-    # -------------------------------------------------------------------------
-    @property
-    def test_root(cls):
-        """Gives access to the current test_root folder path inside
-        the TestCase.
-
-        """
-        return TestCase._test_root
-    # -------------------------------------------------------------------------
-    @test_root.setter
-    def test_root(cls, value):
-        TestCase._test_root = value
+        # walk the suite tree iteratively - deep nesting costs us just
+        # deque appends instead of one Python frame per level
+        stack = deque([test])
+        test_roots = {}
+        while stack:
+            item = stack.popleft()
+            if isinstance(item, unittest.TestSuite):
+                stack.extend(item._tests)
+                continue
+            if isinstance(item, unittest.TestCase):
+                # We can't just do 'isinstance(item, TestCase)' in here
+                # because this fails for TestTextRunners in child processes.
+                # Instead we fall back to comparing the identity of the
+                # parent classes. Feels a bit dodgy, but works...
+                for bc in item.__class__.__mro__:
+                    if (bc.__module__, bc.__qualname__) == _TESTCASE_SIG:
+                        item.settings = settings
+                        test_case_name = item.__class__.__name__
+                        # create each test_root only once per TestCase
+                        # class, and stat the output folder only for
+                        # the very first one
+                        if test_case_name not in test_roots:
+                            test_roots[test_case_name] = _createTestRootFolder(
+                                            settings,
+                                            test_case_name,
+                                            validate_output=not test_roots)
+                        item.test_root = test_roots[test_case_name]
+                        break
 
 
 # -----------------------------------------------------------------------------
-@add_metaclass(TestCaseType)
 class TestCase(unittest.TestCase):
     """TestCase that also provides easy access to associated data such
     as 'test_root',  'setttings' or 'context'.
 
     """
 
-    _test_root = None
-
     # -------------------------------------------------------------------------
     def __init__(self, methodName='runTest', test_run=False,  *args, **kwargs):
         """
         """
         self.__settings = {}
+        # plain per-instance attribute, so parallel test cases can never
+        # stomp on each other's test_root
+        self.test_root = None
 
         if not test_run:
             super(TestCase, self).__init__(methodName, *args, **kwargs)
 
-    # -------------------------------------------------------------------------
-    @property
-    def test_root(self):
-        """Gives access to the current test_root folder path inside
-        the TestCase.
-
-        """
-        return TestCase._test_root
-    # -------------------------------------------------------------------------
-    @test_root.setter
-    def test_root(self, value):
-        TestCase._test_root = value
-
     # -------------------------------------------------------------------------
     @property
     def settings(self):
@@ -1841,10 +2258,8 @@ class TestCase(unittest.TestCase):
     def logHeader(cls):
         """logs the test header.
         """
-        logger.info('')
-        logger.info('-' * 70)
-        logger.info("    Running tests in '{}'".format(cls.__name__))
-        logger.info('-' * 70)
+        logger.info("\n{}\n    Running tests in '{}'\n{}"
+                    .format(_HEADER_BAR, cls.__name__, _HEADER_BAR))
         sys.stdout.flush()
 
 